@@ -20,6 +20,7 @@ from __future__ import annotations
 
 import argparse
 import contextlib
+import functools
 import logging
 import sys
 import textwrap
@@ -38,6 +39,21 @@ from gaphor.UML.modelinglanguage import UMLModelingLanguage
 
 log = logging.getLogger(__name__)
 
+# Large enough to hold a complete generated module
+OUTPUT_BUFFER_SIZE = 256 * 1024
+
+# Model type names and the Python type they are generated as
+PRIMITIVE_TYPES = {
+    "String": "str",
+    "str": "str",
+    "object": "str",
+    "Integer": "int",
+    "int": "int",
+    "Boolean": "int",
+    "bool": "int",
+    "UnlimitedNatural": "int",
+}
+
 header = textwrap.dedent(
     """\
     # This file is generated by coder.py. DO NOT EDIT!
@@ -78,9 +94,13 @@ def main(
     )
     overrides = Overrides(overridesfile) if overridesfile else None
 
-    with (open(outfile, "w") if outfile else contextlib.nullcontext(sys.stdout)) as out:  # type: ignore[attr-defined]
-        for line in coder(model, super_models, overrides):
-            print(line, file=out)
+    with (
+        open(outfile, "w", buffering=OUTPUT_BUFFER_SIZE, encoding="utf-8")
+        if outfile
+        else contextlib.nullcontext(sys.stdout)  # type: ignore[attr-defined]
+    ) as out:
+        lines = coder(model, super_models, overrides)
+        out.write("".join(f"{line}\n" for line in lines))
 
 
 def coder(
@@ -96,10 +116,10 @@ def coder(
             c
             for c in model.select(UML.Class)
             if not (
-                is_enumeration(c)
-                or is_simple_type(c)
+                is_tilde_type(c)
+                or is_enumeration(c)
                 or is_in_profile(c)
-                or is_tilde_type(c)
+                or is_simple_type(c)
             )
         )
     )
@@ -146,9 +166,7 @@ def coder(
 
 
 def class_declaration(class_: UML.Class):
-    base_classes = ", ".join(
-        c.name for c in sorted(bases(class_), key=lambda c: c.name)  # type: ignore[no-any-return]
-    )
+    base_classes = ", ".join(sorted(c.name for c in bases(class_)))
     return f"class {class_.name}({base_classes}):"
 
 
@@ -202,9 +220,9 @@ def associations(
             or is_extension_end(a)
         ):
             continue
-        elif redefines(a):
+        elif redefined := redefines(a):
             redefinitions.append(
-                f'{full_name} = redefine({c.name}, "{a.name}", {a.type.name}, {redefines(a)})'
+                f'{full_name} = redefine({c.name}, "{a.name}", {a.type.name}, {redefined})'
             )
         elif a.isDerived:
             yield f'{full_name} = derivedunion("{a.name}", {a.type.name}{lower(a)}{upper(a)})'
@@ -295,29 +313,33 @@ def opposite(a):
 def order_classes(classes: Iterable[UML.Class]) -> Iterable[UML.Class]:
     seen_classes = set()
 
-    def order(c):
-        if c not in seen_classes:
-            for b in bases(c):
-                yield from order(b)
-            yield c
-            seen_classes.add(c)
-
     for c in classes:
-        yield from order(c)
-
+        if c in seen_classes:
+            continue
+        seen_classes.add(c)
+        stack = [(c, iter(bases(c)))]
+        while stack:
+            current, pending = stack[-1]
+            for b in pending:
+                if b not in seen_classes:
+                    seen_classes.add(b)
+                    stack.append((b, iter(bases(b))))
+                    break
+            else:
+                stack.pop()
+                yield current
 
-def bases(c: UML.Class) -> Iterable[UML.Class]:
-    for g in c.generalization:
-        yield g.general
 
-    for a in c.ownedAttribute:
-        if a.association and a.name == "baseClass":
-            meta_cls = a.association.ownedEnd.class_
-            yield meta_cls
+def bases(c: UML.Class) -> list[UML.Class]:
+    return [g.general for g in c.generalization] + [
+        a.association.ownedEnd.class_
+        for a in c.ownedAttribute
+        if a.name == "baseClass" and a.association
+    ]
 
 
 def is_enumeration(c: UML.Class) -> bool:
-    return c and c.name and (c.name.endswith("Kind") or c.name.endswith("Sort"))  # type: ignore[return-value]
+    return c and c.name and c.name.endswith(("Kind", "Sort"))  # type: ignore[return-value]
 
 
 def is_simple_type(c: UML.Class) -> bool:
@@ -335,29 +357,33 @@ def is_extension_end(a: UML.Property):
 
 
 def is_reassignment(a: UML.Property) -> bool:
-    def test(c: UML.Class):
-        for attr in c.ownedAttribute:
-            if attr.name == a.name:
-                return True
-        return any(test(base) for base in bases(c))
-
-    return any(test(base) for base in bases(a.owner))  # type:ignore[arg-type]
+    seen_classes = set()
+    pending = bases(a.owner)  # type:ignore[arg-type]
+    while pending:
+        c = pending.pop()
+        if c in seen_classes:
+            continue
+        seen_classes.add(c)
+        if any(attr.name == a.name for attr in c.ownedAttribute):
+            return True
+        pending.extend(bases(c))
+    return False
 
 
 def is_in_profile(c: UML.Class) -> bool:
-    def test(p: UML.Package):
-        return isinstance(p, UML.Profile) or (p.owningPackage and test(p.owningPackage))
-
-    return test(c.owningPackage)  # type: ignore[no-any-return]
+    p = c.owningPackage
+    while p:
+        if isinstance(p, UML.Profile):
+            return True
+        p = p.owningPackage
+    return False
 
 
 def is_in_toplevel_package(c: UML.Class, package_name: str) -> bool:
-    def test(p: UML.Package):
-        return (not p.owningPackage and p.name == package_name) or (
-            p.owningPackage and test(p.owningPackage)
-        )
-
-    return test(c.owningPackage)  # type: ignore[no-any-return]
+    p = c.owningPackage
+    while p and p.owningPackage:
+        p = p.owningPackage
+    return bool(p and p.name == package_name)
 
 
 def redefines(a: UML.Property) -> str | None:
@@ -391,15 +417,25 @@ def in_super_model(
     name: str, super_models: list[tuple[str, ElementFactory]]
 ) -> tuple[str, UML.Class] | tuple[None, None]:
     for pkg, factory in super_models:
-        cls: UML.Class
-        for cls in factory.select(  # type: ignore[assignment]
-            lambda e: isinstance(e, UML.Class) and e.name == name
-        ):
-            if not (is_in_profile(cls) or is_enumeration(cls)):
-                return pkg, cls
+        if cls := super_model_classes(factory).get(name):
+            return pkg, cls
     return None, None
 
 
+@functools.lru_cache(maxsize=None)
+def super_model_classes(factory: ElementFactory) -> dict[str, UML.Class]:
+    """Index the classes of a super model by name.
+
+    Super models are loaded once and not changed afterwards, so the
+    index is computed only once per model.
+    """
+    classes: dict[str, UML.Class] = {}
+    for cls in factory.select(UML.Class):
+        if not (is_in_profile(cls) or is_enumeration(cls)):
+            classes.setdefault(cls.name, cls)
+    return classes
+
+
 def load_model(modelfile: str) -> ElementFactory:
     element_factory = ElementFactory()
     uml_modeling_language = MockModelingLanguage(
@@ -418,24 +454,15 @@ def load_model(modelfile: str) -> ElementFactory:
 
 def resolve_attribute_type_values(element_factory: ElementFactory) -> None:
     """Some model updates that are hard to do from Gaphor itself."""
+    classes_by_name: dict[str, UML.Class] = {}
+    for cls in element_factory.select(UML.Class):
+        classes_by_name.setdefault(cls.name, cls)
+
     for prop in element_factory.select(UML.Property):
-        if prop.typeValue in ("String", "str", "object"):
-            prop.typeValue = "str"
-        elif prop.typeValue in (
-            "Integer",
-            "int",
-            "Boolean",
-            "bool",
-            "UnlimitedNatural",
-        ):
-            prop.typeValue = "int"
+        if type_value := PRIMITIVE_TYPES.get(prop.typeValue):
+            prop.typeValue = type_value
         else:
-            c: UML.Class | None = next(
-                element_factory.select(
-                    lambda e: isinstance(e, UML.Class) and e.name == prop.typeValue
-                ),  # type: ignore[arg-type]
-                None,
-            )
+            c = classes_by_name.get(prop.typeValue)
             if c:
                 prop.type = c
                 del prop.typeValue
@@ -193,6 +193,14 @@ def test_order_classes(uml_metamodel):
     assert classes[1].name == "NamedElement"
 
 
+def test_order_classes_emits_bases_first(uml_metamodel):
+    classes = list(order_classes(uml_metamodel.select(UML.Class)))
+    position = {c: i for i, c in enumerate(classes)}
+
+    assert len(position) == len(classes)
+    assert all(position[b] < position[c] for c in classes for b in bases(c))
+
+
 def test_coder_write_association(navigable_association: UML.Association):
 
     a = list(associations(navigable_association.memberEnd[0].type))
@@ -77,17 +77,7 @@ class DiagramDirective(sphinx.util.docutils.SphinxDirective):
         )
         outdir.mkdir(exist_ok=True)
 
-        diagram = next(
-            model.select(
-                lambda e: isinstance(e, Diagram) and ".".join(e.qualifiedName) == name
-            ),
-            None,
-        )
-
-        if not diagram:
-            diagram = next(
-                model.select(lambda e: isinstance(e, Diagram) and e.name == name), None
-            )
+        diagram = find_diagram(model, name)
 
         if not diagram:
             return self.logging_error_node(
@@ -118,6 +108,25 @@ class DiagramDirective(sphinx.util.docutils.SphinxDirective):
         return [nodes.error("", nodes.paragraph(text=text))]
 
 
+def find_diagram(model: ElementFactory, name: str) -> Diagram | None:
+    """Find a diagram by qualified name, or else by plain name."""
+    by_qualified_name, by_name = diagram_index(model)
+    return by_qualified_name.get(name) or by_name.get(name)
+
+
+@functools.lru_cache(maxsize=None)
+def diagram_index(
+    model: ElementFactory,
+) -> tuple[dict[str, Diagram], dict[str, Diagram]]:
+    """Index the diagrams in a (cached) model by qualified name and by name."""
+    by_qualified_name: dict[str, Diagram] = {}
+    by_name: dict[str, Diagram] = {}
+    for diagram in model.select(Diagram):
+        by_qualified_name.setdefault(".".join(diagram.qualifiedName), diagram)
+        by_name.setdefault(diagram.name, diagram)
+    return by_qualified_name, by_name
+
+
 @functools.lru_cache(maxsize=None)
 def load_model(model_file: str) -> ElementFactory:
     element_factory = ElementFactory()
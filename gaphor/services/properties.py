@@ -122,7 +122,7 @@ class Properties(Service):
 
         filename = self.filename
 
-        if os.path.exists(filename) and os.path.isfile(filename):
+        if os.path.isfile(filename):
 
             with open(filename) as ifile:
                 data = ifile.read()
@@ -323,7 +323,7 @@ class ProgressGenerator:
     reading and that it will be closed elsewhere.
     """
 
-    def __init__(self, input, output, block_size=512):
+    def __init__(self, input, output, block_size=64 * 1024):
         """Initialize the progress generator.
 
         The input parameter is a file object.  The output parameter is